@@ -19,7 +19,6 @@ def hello_world():
         "0xbEbc44782C7dB0a1A60Cb6fe97d0b483032FF1C7",
         A=[100, 1000],
         fee=[3000000, 4000000],
-        ncpu=1,
     )
     elapsed = time.time() - t
     print("Elapsed time:", elapsed)
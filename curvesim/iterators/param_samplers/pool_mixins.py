@@ -5,6 +5,8 @@ of pool instances configured by different simulation parameters.
 Each mixin defines a different pool type and a set of special attribute setters.
 """
 
+from functools import lru_cache
+
 from curvesim.pool.cryptoswap.calcs import newton_D
 from curvesim.pool.sim_interface import (
     SimCurveCryptoPool,
@@ -61,6 +63,37 @@ class CurveCryptoPoolMixin:
     Defines special attribute setters.
     """
 
+    def __init__(self, *args, **kwargs):
+        # D values cached by a previous sampler are not needed anymore
+        _newton_D_cached.cache_clear()
+        super().__init__(*args, **kwargs)
+
+    def set_pool_attributes(self, pool, attribute_dict):
+        """
+        Sets the pool attributes defined in attribute_dict.
+
+        The A and gamma setters both recompute D and virtual_price, which only
+        depend on the final (A, gamma) pair. When both are given, the first
+        one is set directly and only the second runs its setter, so each pool
+        needs a single `newton_D` solve.
+
+        Parameters
+        ----------
+        pool : :class:`~curvesim.templates.SimPool`
+            The pool object to be modified.
+
+        attribute_dict : dict
+            A dict mapping attribute names to values.
+        """
+        if attribute_dict and "A" in attribute_dict and "gamma" in attribute_dict:
+            first = next(key for key in attribute_dict if key in ("A", "gamma"))
+            setattr(pool, first, attribute_dict[first])
+            attribute_dict = {
+                key: val for key, val in attribute_dict.items() if key != first
+            }
+
+        super().set_pool_attributes(pool, attribute_dict)
+
     @property
     def _pool_type(self):
         return SimCurveCryptoPool
@@ -94,7 +127,7 @@ def set_cryptoswap_A(pool, A):
     """
     xp = pool._xp()  # pylint: disable=protected-access
     gamma = pool.gamma
-    D = newton_D(A, gamma, xp)
+    D = _newton_D_cached(A, gamma, tuple(xp))
     pool.D = D
     pool.A = A
     virtual_price = pool.get_virtual_price()
@@ -115,13 +148,42 @@ def set_cryptoswap_gamma(pool, gamma):
     """
     xp = pool._xp()  # pylint: disable=protected-access
     A = pool.A
-    D = newton_D(A, gamma, xp)
+    D = _newton_D_cached(A, gamma, tuple(xp))
     pool.D = D
     pool.gamma = gamma
     virtual_price = pool.get_virtual_price()
     pool.virtual_price = virtual_price
 
 
+@lru_cache(maxsize=4096)
+def _newton_D_cached(A, gamma, xp):
+    """
+    Memoized :func:`newton_D` for the cryptoswap setters.
+
+    Pools in a parameter grid are copies of the same template, so the same
+    (A, gamma, xp) combination typically recurs across runs.
+
+    Samplers are iterated in the parent process before runs are dispatched
+    to workers (see :func:`curvesim.pipelines.run_pipeline`), so this
+    process-local cache already spans the whole grid when `ncpu > 1`.
+
+    Parameters
+    ----------
+    A : int
+        The A parameter
+    gamma : int
+        The gamma parameter
+    xp : tuple of int
+        The pool balances in units of `D`; a tuple so it can be hashed.
+
+    Returns
+    -------
+    int
+        The invariant D.
+    """
+    return newton_D(A, gamma, list(xp))
+
+
 def stableswap_D_to_balances(pool, D):
     """
     Sets the balance for each token in the pool based on the provided
@@ -135,7 +197,8 @@ def stableswap_D_to_balances(pool, D):
     """
     rates = pool.rates
     n = pool.n
-    pool.balances = [D // n * 10**18 // r for r in rates]
+    D_per_coin = D // n * 10**18
+    pool.balances = [D_per_coin // r for r in rates]
 
 
 def stableswap_D_base_to_balances(pool, D_base):
@@ -152,7 +215,8 @@ def stableswap_D_base_to_balances(pool, D_base):
     basepool = pool.basepool
     rates = basepool.rates
     n = basepool.n
-    basepool.balances = [D_base // n * 10**18 // r for r in rates]
+    D_per_coin = D_base // n * 10**18
+    basepool.balances = [D_per_coin // r for r in rates]
 
 
 def cryptoswap_D_to_balances(pool, D):
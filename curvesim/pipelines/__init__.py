@@ -46,7 +46,7 @@ def run_pipeline(param_sampler, price_sampler, strategy, ncpu=4):
         A function dictating what happens at each timestep.
 
     ncpu : int, default=4
-        Number of cores to use.
+        Number of cores to use; capped at the number of simulation runs.
 
     Returns
     -------
@@ -54,12 +54,15 @@ def run_pipeline(param_sampler, price_sampler, strategy, ncpu=4):
         Contains the metrics produced by the strategy.
 
     """
+    strategy_args_list = [
+        (pool, params, price_sampler) for pool, params in param_sampler
+    ]
+
+    # Extra workers would only add process start-up cost
+    ncpu = min(ncpu, len(strategy_args_list))
+
     if ncpu > 1:
         with multiprocessing_logging_queue() as logging_queue:
-            strategy_args_list = [
-                (pool, params, price_sampler) for pool, params in param_sampler
-            ]
-
             wrapped_args_list = [
                 (strategy, logging_queue, *args) for args in strategy_args_list
             ]
@@ -73,8 +76,8 @@ def run_pipeline(param_sampler, price_sampler, strategy, ncpu=4):
 
     else:
         results = []
-        for pool, params in param_sampler:
-            metrics = strategy(pool, params, price_sampler)
+        for args in strategy_args_list:
+            metrics = strategy(*args)
             results.append(metrics)
         results = tuple(zip(*results))
 
@@ -29,11 +29,12 @@ def geometric_mean(unsorted_x: List[int], sort: bool) -> int:
     if sort:
         x = sorted(unsorted_x, reverse=True)
 
-    D: int = mpz(x[0])
+    D: int = x[0]
+    prod: int = x[0] * x[1]
     diff: int = 0
     for _ in range(255):
         D_prev: int = D
-        D = (D + x[0] * x[1] // D) // n_coins
+        D = (D + prod // D) // n_coins
         diff = abs(D_prev - D)
         if diff <= 1 or diff * 10**18 < D:
             return int(D)
@@ -189,22 +190,24 @@ def newton_D(  # noqa: complexity: 13
     x: List[int] = sorted(x_unsorted, reverse=True)
 
     assert 10**9 <= x[0] <= 10**15 * 10**18
-    for i in range(1, n_coins):
-        frac: int = x[i] * 10**18 // x[0]
-        assert frac >= 10**11
+    assert _balances_safe(x)
 
     D: int = n_coins * geometric_mean(x, False)
     S: int = sum(x)
 
+    g_plus: int = gamma + 10**18
+    # D-independent factor of K0, scaled once outside the loop
+    x0_scaled: int = (10**18 * n_coins**2) * x[0]
+
     D = mpz(D)
     S = mpz(S)
     for _ in range(255):
         D_prev: int = D
 
         # formula for 2 coins
-        K0: int = (10**18 * n_coins**2) * x[0] // D * x[1] // D
+        K0: int = x0_scaled // D * x[1] // D
 
-        _g1k0: int = abs(gamma + 10**18 - K0) + 1
+        _g1k0: int = abs(g_plus - K0) + 1
 
         # D / (A * N**N) * _g1k0**2 / gamma**2
         mul1: int = 10**18 * D // gamma * _g1k0 // gamma * _g1k0 * A_MULTIPLIER // ANN
@@ -231,7 +234,8 @@ def newton_D(  # noqa: complexity: 13
 
         diff = abs(D - D_prev)
         # Could reduce precision for gas efficiency here
-        if diff * 10**14 < max(10**16, D):
+        # Same test as `diff * 10**14 < max(10**16, D)`, without the max() call
+        if diff < 100 or diff * 10**14 < D:
             # Test that we are safe with the next newton_y
             for _x in x:
                 frac = _x * 10**18 // D
@@ -240,3 +244,14 @@ def newton_D(  # noqa: complexity: 13
             return int(D)
 
     raise CalculationError("Did not converge")
+
+
+def _balances_safe(x: List[int]) -> bool:
+    """
+    Check that no balance is too small relative to the largest, x[0].
+    """
+    for i in range(1, len(x)):
+        frac: int = x[i] * 10**18 // x[0]
+        if frac < 10**11:
+            return False
+    return True
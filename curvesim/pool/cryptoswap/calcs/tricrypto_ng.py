@@ -21,6 +21,10 @@ MAX_GAMMA = 5 * 10**16
 EXP_PRECISION = 10**10
 
 PRECISION = 10**18  # The precision to convert to
+# Too large for CPython to constant-fold, so `10**36` in a function body
+# is recomputed on every call; bound once for `_cbrt`, `get_p` and the
+# `newton_D` seed.
+PRECISION_SQ = 10**36
 A_MULTIPLIER = 10000
 
 N_COINS = 3
@@ -367,7 +371,7 @@ def get_p(
 
     # K0 = P * N**N / D**N.
     # K0 is dimensionless and has 10**36 precision:
-    K0: int = N**N * xp[0] * xp[1] // D * xp[2] // D * 10**36 // D
+    K0: int = N**N * xp[0] * xp[1] // D * xp[2] // D * PRECISION_SQ // D
 
     # GK0 is in 10**36 precision and is dimensionless.
     # GK0 = (
@@ -376,37 +380,41 @@ def get_p(
     #     - (K0 * K0 / 10**36 * (2 * gamma + 3 * 10**18) / 10**18)
     # )
     # GK0 is always positive. So the following should never revert:
+    K0_sq: int = K0**2
     GK0: int = (
-        2 * K0**2 // 10**36 * K0 // 10**36
+        2 * K0_sq // PRECISION_SQ * K0 // PRECISION_SQ
         + (gamma + 10**18) ** 2
-        - (K0**2 // 10**36 * (2 * gamma + 3 * 10**18) // 10**18)
+        - (K0_sq // PRECISION_SQ * (2 * gamma + 3 * 10**18) // 10**18)
     )
 
     # NNAG2 = A * gamma**2
     NNAG2: int = A * gamma**2 // A_MULTIPLIER
 
     # denominator = (GK0 + NNAG2 * x / D * K0 / 10**36)
-    denominator: int = GK0 + NNAG2 * xp[0] // D * K0 // 10**36
+    denominator: int = GK0 + NNAG2 * xp[0] // D * K0 // PRECISION_SQ
 
     # p_xy = x * (GK0 + NNAG2 * y / D * K0 / 10**36) / y * 10**18 / denominator
     # p_xz = x * (GK0 + NNAG2 * z / D * K0 / 10**36) / z * 10**18 / denominator
     # p is in 10**18 precision.
-    return [
-        (
-            xp[0]
-            * (GK0 + NNAG2 * xp[1] // D * K0 // 10**36)
-            // xp[1]
-            * 10**18
-            // denominator
-        ),
-        (
-            xp[0]
-            * (GK0 + NNAG2 * xp[2] // D * K0 // 10**36)
-            // xp[2]
-            * 10**18
-            // denominator
-        ),
-    ]
+    p_xy: int = (
+        xp[0]
+        * (GK0 + NNAG2 * xp[1] // D * K0 // PRECISION_SQ)
+        // xp[1]
+        * 10**18
+        // denominator
+    )
+    if xp[2] == xp[1]:
+        # p_xz is the same expression with z in place of y
+        return [p_xy, p_xy]
+
+    p_xz: int = (
+        xp[0]
+        * (GK0 + NNAG2 * xp[2] // D * K0 // PRECISION_SQ)
+        // xp[2]
+        * 10**18
+        // denominator
+    )
+    return [p_xy, p_xz]
 
 
 def newton_D(  # pylint: disable=too-many-locals
@@ -437,8 +445,8 @@ def newton_D(  # pylint: disable=too-many-locals
         # so the following is safe to do:
         D = N_COINS * geometric_mean(x)
     else:
-        if S > 10**36:
-            D = _cbrt(x[0] * x[1] // 10**36 * x[2] // K0_prev * 27 * 10**12)
+        if S > PRECISION_SQ:
+            D = _cbrt(x[0] * x[1] // PRECISION_SQ * x[2] // K0_prev * 27 * 10**12)
         elif S > 10**24:
             D = _cbrt(x[0] * x[1] // 10**24 * x[2] // K0_prev * 27 * 10**6)
         else:
@@ -456,23 +464,29 @@ def newton_D(  # pylint: disable=too-many-locals
     D_minus: int = 0
     D_prev: int = 0
 
+    # The balance factors of K0 do not depend on D, so they are scaled once
+    # here rather than on every iteration.  Multiplication is applied before
+    # each floor division, so the result is unchanged.
+    x0_scaled: int = 10**18 * x[0] * N_COINS
+    x1_scaled: int = x[1] * N_COINS
+    x2_scaled: int = x[2] * N_COINS
+    g_plus: int = gamma + 10**18
+
     D = mpz(D)
 
     for _ in range(255):
         D_prev = D
 
         # K0 = 10**18 * x[0] * N_COINS / D * x[1] * N_COINS / D * x[2] * N_COINS / D
-        K0 = 10**18 * x[0] * N_COINS // D * x[1] * N_COINS // D * x[2] * N_COINS // D
+        K0 = x0_scaled // D * x1_scaled // D * x2_scaled // D
         # <-------- We can convert the entire expression using unsafe math.
         #   since x_i is not too far from D, so overflow is not expected. Also
         #      D > 0, since we proved that already. unsafe_div is safe. K0 > 0
         #        since we can safely assume that D < 10**18 * x[0]. K0 is also
         #                            in the range of 10**18 (it's a property).
 
-        _g1k0 = gamma + 10**18  # <--------- safe to do unsafe_add.
-
         # The following operations can safely be unsafe.
-        _g1k0 = abs(_g1k0 - K0) + 1
+        _g1k0 = abs(g_plus - K0) + 1  # g_plus = gamma + 10**18
 
         # D / (A * N**N) * _g1k0**2 / gamma**2
         # mul1 = 10**18 * D / gamma * _g1k0 / gamma * _g1k0 * A_MULTIPLIER / ANN
@@ -524,16 +538,26 @@ def newton_D(  # pylint: disable=too-many-locals
 
         diff: int = abs(D - D_prev)
         # Could reduce precision for gas efficiency here:
-        if diff * 10**14 < max(10**16, D):
+        # Same test as `diff * 10**14 < max(10**16, D)`, without the max() call
+        if diff < 100 or diff * 10**14 < D:
             # Test that we are safe with the next get_y
-            for _x in x:
-                frac: int = (_x * 10**18) // D
-                assert 10**16 <= frac <= 10**20, "Unsafe values x[i]"
+            assert _safe_for_get_y(x, D), "Unsafe values x[i]"
             return int(D)
 
     raise CalculationError("Did not converge")
 
 
+def _safe_for_get_y(x: List[int], D: int) -> bool:
+    """
+    Check that every balance is within the range get_y accepts for D.
+    """
+    for _x in x:
+        frac: int = (_x * 10**18) // D
+        if not 10**16 <= frac <= 10**20:
+            return False
+    return True
+
+
 def _cbrt(x: int) -> int:
 
     xx: int = 0
@@ -542,7 +566,7 @@ def _cbrt(x: int) -> int:
     elif x >= 115792089237316195423570985008687907853269:
         xx = x * 10**18
     else:
-        xx = x * 10**36
+        xx = x * PRECISION_SQ
 
     log2x: int = _snekmate_log_2(xx, False)
 
@@ -559,7 +583,8 @@ def _cbrt(x: int) -> int:
     # initial_guess = 2 ** pow * 1260 ** remainder // 1000 ** remainder
 
     remainder: int = log2x % 3
-    a: int = (2 ** (log2x // 3) * (1260**remainder)) // 1000**remainder
+    # 2 ** pow as a shift; avoids a generic big-int pow call
+    a: int = ((1 << (log2x // 3)) * (1260**remainder)) // 1000**remainder
 
     # Because we chose good initial values for cube roots, 7 newton raphson iterations
     # are just about sufficient. 6 iterations would result in non-convergences, and 8
@@ -597,34 +622,12 @@ def _snekmate_log_2(x: int, roundup: bool) -> int:
            to round up or not. The default `False` is round down.
     @return int The 32-byte calculation result.
     """
-    value: int = x
-    result: int = 0
-
-    # The following lines cannot overflow because we have the well-known
-    # decay behaviour of `log_2(max_value(uint256)) < max_value(uint256)`.
-    if x >> 128 != 0:
-        value = x >> 128
-        result = 128
-    if value >> 64 != 0:
-        value = value >> 64
-        result = result + 64
-    if value >> 32 != 0:
-        value = value >> 32
-        result = result + 32
-    if value >> 16 != 0:
-        value = value >> 16
-        result = result + 16
-    if value >> 8 != 0:
-        value = value >> 8
-        result = result + 8
-    if value >> 4 != 0:
-        value = value >> 4
-        result = result + 4
-    if value >> 2 != 0:
-        value = value >> 2
-        result = result + 2
-    if value >> 1 != 0:
-        result = result + 1
+    if x == 0:
+        return 0
+
+    # For a uint256 `x`, this is the same index of the highest set bit that
+    # the contract finds by binary search.
+    result: int = x.bit_length() - 1
 
     if roundup and (1 << result) < x:
         result = result + 1
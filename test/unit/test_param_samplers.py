@@ -290,6 +290,24 @@ def test_ParameterizedPoolIterator_curve_crypto_pool(
     )
 
 
+def test_ParameterizedPoolIterator_curve_crypto_pool_D(sim_curve_crypto_pool):
+    """
+    Test that D is recomputed for each sampled A and gamma, including
+    repeated combinations and repeated iterations.
+    """
+    variable_params = {
+        "A": [400000, 400000, 2000000],
+        "gamma": [10**14, 2 * 10**14],
+    }
+    param_sampler = ParameterizedPoolIterator(sim_curve_crypto_pool, variable_params)
+
+    for _ in range(2):
+        for pool, params in param_sampler:
+            # pylint: disable-next=protected-access
+            expected_D = newton_D(params["A"], params["gamma"], pool._xp())
+            assert pool.D == expected_D
+
+
 # Helper functions for tests
 def _test_ParameterizedPoolIterator(pool, variable_params, fixed_params, pool_map=None):
     """
@@ -17,7 +17,9 @@ from curvesim.pool.cryptoswap.calcs.tricrypto_ng import (
     MIN_A,
     MIN_GAMMA,
     PRECISION,
+    _cbrt,
     _newton_y,
+    _snekmate_log_2,
     wad_exp,
 )
 
@@ -296,6 +298,33 @@ def test_get_p(tricrypto_math, A, gamma, x0, x1, x2):
     assert p == expected_p
 
 
+@given(
+    amplification_coefficient,
+    gamma_coefficient,
+    positive_balance,
+    positive_balance,
+)
+@settings(
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+    max_examples=2,
+    deadline=None,
+)
+def test_get_p_equal_balances(tricrypto_math, A, gamma, x0, x1):
+    """Test `get_p` against vyper implementation when xp[1] == xp[2]."""
+
+    xp = [x0, x1, x1]
+    assume(0.02 < xp[0] / xp[1] < 50)
+
+    # pylint: disable=no-member
+    D = tricrypto_math.newton_D(A, gamma, xp)
+
+    A_gamma = [A, gamma]
+    expected_p = tricrypto_math.get_p(xp, D, A_gamma)
+    p = get_p(xp, D, A, gamma)
+
+    assert p == expected_p
+
+
 @given(
     amplification_coefficient,
     gamma_coefficient,
@@ -420,6 +449,33 @@ def test_wad_exp(tricrypto_math, x):
     assert result == expected_result
 
 
+@given(st.integers(min_value=0, max_value=2**256 - 1), st.booleans())
+@settings(
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+    max_examples=5,
+    deadline=None,
+)
+def test_snekmate_log_2(tricrypto_math, x, roundup):
+    """Test the snekmate log2 calc"""
+    expected_result = tricrypto_math.eval(f"self._snekmate_log_2({x}, {roundup})")
+    result = _snekmate_log_2(x, roundup)
+    assert result == expected_result
+
+
+@given(st.integers(min_value=1, max_value=2**256 - 1))
+@settings(
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+    max_examples=5,
+    deadline=None,
+)
+def test_cbrt(tricrypto_math, x):
+    """Test the cube root calc"""
+    # pylint: disable=no-member
+    expected_result = tricrypto_math.cbrt(x)
+    result = _cbrt(x)
+    assert result == expected_result
+
+
 @given(
     amplification_coefficient,
     gamma_coefficient,